@@ -1,21 +1,552 @@
 # Author: Owen Rotenberg
 # Provides real-time stock market data via yfinance as MCP tools.
 
+import asyncio
+import functools
 import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Callable
 from typing import Any
 
+import backoff
+import msgspec
 import yfinance as yf
+from cachetools import TLRUCache
 from mcp.server.fastmcp import FastMCP
+from yfinance.exceptions import YFRateLimitError
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import redis
+except ImportError:  # redis is an optional shared cache
+    redis = None
 
 mcp = FastMCP("live-market-data")
 
+# Cache lifetimes (seconds), chosen by how quickly each kind of data goes stale.
+_QUOTE_TTL = 30
+_STATS_TTL = 3600
+_HISTORY_TTL = 60
+_NEWS_TTL = 300
+
+
+def _connect_redis() -> "redis.Redis | None":
+    url = os.environ.get("REDIS_URL")
+    if redis is None or not url:
+        return None
+    try:
+        # Short timeouts so an unreachable Redis degrades to a cache miss
+        # instead of stalling every tool call.
+        return redis.Redis.from_url(
+            url,
+            decode_responses=False,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    except ValueError as exc:
+        logging.getLogger(__name__).warning("Ignoring invalid REDIS_URL: %s", exc)
+        return None
+
+
+_redis = _connect_redis()
+
+
+def _encode_default(obj: Any) -> Any:
+    # numpy arrays and scalars, for encoders that can't walk them natively.
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_encode_default, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, default=_encode_default).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _ttl_cache(
+    ttl: int, redis_prefix: str | None = None, maxsize: int = 512
+) -> Callable[[Callable], Callable]:
+    """Memoize a function in-process, keyed on its positional arguments.
+
+    With ``redis_prefix`` the result is also shared through Redis under
+    ``<redis_prefix>:<arg>:<arg>...``, and a value read back from Redis expires
+    here when its shared copy does.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache: TLRUCache = TLRUCache(
+            maxsize=maxsize, ttu=lambda _key, entry, now: now + entry[1]
+        )
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            with lock:
+                try:
+                    return cache[args][0]
+                except KeyError:
+                    pass
+            if redis_prefix is None:
+                value = func(*args)
+                seconds_left = ttl if value else 0
+            else:
+                key = ":".join((redis_prefix, *args))
+                value, seconds_left = _redis_cached(key, ttl, lambda: func(*args))
+            if seconds_left > 0:
+                with lock:
+                    cache[args] = (value, min(ttl, seconds_left))
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _redis_cached(
+    key: str, ttl: int, fetch: Callable[[], Any]
+) -> tuple[Any, float]:
+    """Return the value shared in Redis under ``key``, calling ``fetch`` on a miss.
+
+    Also returns how many seconds the value has left to live. Calls ``fetch``
+    directly when Redis is not configured or unreachable.
+
+    Empty results are never cached and get no lifetime: yfinance reports most
+    failures as an empty frame or list, and one hiccup shouldn't be served as
+    "no data" to every instance until it expires.
+    """
+    shared = _redis is not None
+    if shared:
+        try:
+            raw, pttl = _redis.pipeline().get(key).pttl(key).execute()
+        except redis.RedisError:
+            shared = False
+        else:
+            if raw is not None:
+                # PTTL is negative if the key expired between the two reads.
+                return _loads(raw), max(pttl, 0) / 1000
+    value = fetch()
+    if not value:
+        return value, 0
+    if shared:
+        try:
+            _redis.set(key, _dumps(value), ex=ttl)
+        except redis.RedisError:
+            pass
+    return value, ttl
+
+
+# Cap concurrent Yahoo requests across all tools; cache hits never take a slot.
+_YAHOO_SLOTS = threading.BoundedSemaphore(8)
+
+
+def _yahoo_call(func: Callable) -> Callable:
+    """Throttle a function that hits Yahoo and retry it with backoff on 429s."""
+
+    @backoff.on_exception(
+        backoff.expo, YFRateLimitError, max_tries=4, jitter=backoff.full_jitter
+    )
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> Any:
+        # The slot is released before backoff sleeps, so waiting retries don't
+        # hold up other symbols.
+        with _YAHOO_SLOTS:
+            return func(*args)
+
+    return wrapper
+
+
+@_yahoo_call
+def _fetch_info(symbol: str) -> dict[str, Any]:
+    return yf.Ticker(symbol).info
+
+
+@_yahoo_call
+def _fetch_history(symbol: str, period: str, interval: str) -> dict[str, Any]:
+    hist = yf.Ticker(symbol).history(period=period, interval=interval)
+    if hist.empty:
+        return {}
+
+    # Keep the columns as numpy arrays; the encoder walks them without boxing.
+    # Round the OHLC block as one array (one row per column) instead of building
+    # a rounded copy of the DataFrame first.
+    prices = hist[["Open", "High", "Low", "Close"]].to_numpy().T.round(2)
+    open_, high, low, close = prices
+    return {
+        "date": hist.index.astype(str).tolist(),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": hist["Volume"].to_numpy(dtype="int64"),
+    }
+
+
+@_yahoo_call
+def _fetch_news(symbol: str) -> list[dict[str, Any]]:
+    return yf.Ticker(symbol).news
+
+
+@_ttl_cache(ttl=_QUOTE_TTL, redis_prefix="yf:info")
+def _info(symbol: str) -> dict[str, Any]:
+    """Quote-grade info: prices and volumes that move within seconds."""
+    return _fetch_info(symbol)
+
+
+@_ttl_cache(ttl=_STATS_TTL)
+def _info_long(symbol: str) -> dict[str, Any]:
+    """Info for near-static fields: fundamentals, ratios, company profile.
+
+    Taken from the quote tier, so one Yahoo fetch (and one Redis copy) serves
+    both; this tier just keeps the payload for longer.
+    """
+    return _info(symbol)
+
+
+@_ttl_cache(ttl=_HISTORY_TTL, redis_prefix="yf:history")
+def _history(symbol: str, period: str, interval: str) -> dict[str, Any]:
+    return _fetch_history(symbol, period, interval)
+
+
+@_ttl_cache(ttl=_NEWS_TTL, redis_prefix="yf:news")
+def _news(symbol: str) -> list[dict[str, Any]]:
+    return _fetch_news(symbol)
 
-def _get_ticker(symbol: str) -> yf.Ticker:
-    return yf.Ticker(symbol)
+
+# Responses are compact for the model; set MCP_JSON_INDENT=1 to pretty-print them.
+_JSON_INDENT = os.environ.get("MCP_JSON_INDENT") == "1"
+
+
+_msgspec_encoder = msgspec.json.Encoder(enc_hook=_encode_default)
 
 
 def _json(data: Any) -> str:
-    return json.dumps(data, indent=2)
+    if isinstance(data, msgspec.Struct):
+        raw = _msgspec_encoder.encode(data)
+        if _JSON_INDENT:
+            raw = msgspec.json.format(raw, indent=2)
+        return raw.decode()
+    if orjson is not None:
+        # History columns are numpy arrays, which orjson only encodes on request.
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if _JSON_INDENT:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_encode_default, option=option).decode()
+    if _JSON_INDENT:
+        return json.dumps(data, indent=2, default=_encode_default)
+    return json.dumps(data, separators=(",", ":"), default=_encode_default)
+
+
+# Response bodies. Field order and types are fixed here, so msgspec encodes them
+# without building an intermediate dict per call.
+class Quote(msgspec.Struct):
+    symbol: str
+    name: str
+    price: float | None
+    change: float | None
+    change_percent: float | None
+    previous_close: float | None
+    open: float | None
+    day_high: float | None
+    day_low: float | None
+    volume: int | None
+    bid: float | None
+    ask: float | None
+    currency: str
+
+
+class CompanyProfile(msgspec.Struct):
+    symbol: str
+    name: str
+    sector: str
+    industry: str
+    description: str
+    country: str
+    website: str
+    employees: int | None
+    ceo: str | None
+
+
+class KeyStatistics(msgspec.Struct):
+    symbol: str
+    market_cap: int | None
+    enterprise_value: int | None
+    fifty_two_week_high: float | None
+    fifty_two_week_low: float | None
+    fifty_day_average: float | None
+    two_hundred_day_average: float | None
+    beta: float | None
+    shares_outstanding: int | None
+    float_shares: int | None
+    short_ratio: float | None
+    short_percent_of_float: float | None
+    held_percent_insiders: float | None
+    held_percent_institutions: float | None
+
+
+class ValuationMetrics(msgspec.Struct):
+    symbol: str
+    trailing_pe: float | None
+    forward_pe: float | None
+    peg_ratio: float | None
+    price_to_book: float | None
+    price_to_sales: float | None
+    enterprise_to_revenue: float | None
+    enterprise_to_ebitda: float | None
+    trailing_eps: float | None
+    forward_eps: float | None
+    book_value: float | None
+
+
+class FinancialHealth(msgspec.Struct):
+    symbol: str
+    profit_margin: float | None
+    operating_margin: float | None
+    gross_margin: float | None
+    return_on_equity: float | None
+    return_on_assets: float | None
+    debt_to_equity: float | None
+    current_ratio: float | None
+    quick_ratio: float | None
+    total_revenue: int | None
+    revenue_growth: float | None
+    earnings_growth: float | None
+    ebitda: int | None
+    free_cash_flow: int | None
+    operating_cash_flow: int | None
+    total_cash: int | None
+    total_debt: int | None
+
+
+class DividendInfo(msgspec.Struct):
+    symbol: str
+    dividend_yield: float | None
+    dividend_rate: float | None
+    payout_ratio: float | None
+    ex_dividend_date: int | None
+    last_dividend_value: float | None
+    last_dividend_date: int | None
+    five_year_avg_dividend_yield: float | None
+    trailing_annual_dividend_rate: float | None
+    trailing_annual_dividend_yield: float | None
+
+
+class AnalystTargets(msgspec.Struct, omit_defaults=True):
+    symbol: str
+    recommendation: str
+    recommendation_mean: float | None
+    number_of_analysts: int | None
+    target_high: float | None
+    target_low: float | None
+    target_mean: float | None
+    target_median: float | None
+    current_price: float | None
+    # Only present when both a mean target and a current price are known.
+    upside_percent: float | None = None
+
+
+class NewsArticle(msgspec.Struct):
+    title: str | None
+    publisher: str | None
+    link: str | None
+    published: int | None
+
+
+class StockNews(msgspec.Struct):
+    symbol: str
+    article_count: int
+    articles: list[NewsArticle]
+
+
+class ComparisonRow(msgspec.Struct):
+    symbol: str
+    name: str
+    price: float | None
+    market_cap: int | None
+    pe_ratio: float | None
+    forward_pe: float | None
+    dividend_yield: float | None
+    beta: float | None
+    fifty_two_week_high: float | None
+    fifty_two_week_low: float | None
+    percent_from_52w_low: float | None
+    profit_margin: float | None
+    revenue_growth: float | None
+
+
+class ComparisonError(msgspec.Struct):
+    symbol: str
+    error: str
+
+
+class Comparison(msgspec.Struct):
+    comparison: list[ComparisonRow | ComparisonError]
+    stocks_compared: int
+
+
+# Tool response fields as (output key, yfinance info key, default).
+_QUOTE_FIELDS = (
+    ("bid", "bid", None),
+    ("ask", "ask", None),
+    ("currency", "currency", "USD"),
+)
+
+_PROFILE_FIELDS = (
+    ("sector", "sector", "N/A"),
+    ("industry", "industry", "N/A"),
+    ("description", "longBusinessSummary", "N/A"),
+    ("country", "country", "N/A"),
+    ("website", "website", "N/A"),
+    ("employees", "fullTimeEmployees", None),
+)
+
+_KEY_STATISTICS_FIELDS = (
+    ("market_cap", "marketCap", None),
+    ("enterprise_value", "enterpriseValue", None),
+    ("fifty_two_week_high", "fiftyTwoWeekHigh", None),
+    ("fifty_two_week_low", "fiftyTwoWeekLow", None),
+    ("fifty_day_average", "fiftyDayAverage", None),
+    ("two_hundred_day_average", "twoHundredDayAverage", None),
+    ("beta", "beta", None),
+    ("shares_outstanding", "sharesOutstanding", None),
+    ("float_shares", "floatShares", None),
+    ("short_ratio", "shortRatio", None),
+    ("short_percent_of_float", "shortPercentOfFloat", None),
+    ("held_percent_insiders", "heldPercentInsiders", None),
+    ("held_percent_institutions", "heldPercentInstitutions", None),
+)
+
+_VALUATION_FIELDS = (
+    ("trailing_pe", "trailingPE", None),
+    ("forward_pe", "forwardPE", None),
+    ("peg_ratio", "pegRatio", None),
+    ("price_to_book", "priceToBook", None),
+    ("price_to_sales", "priceToSalesTrailing12Months", None),
+    ("enterprise_to_revenue", "enterpriseToRevenue", None),
+    ("enterprise_to_ebitda", "enterpriseToEbitda", None),
+    ("trailing_eps", "trailingEps", None),
+    ("forward_eps", "forwardEps", None),
+    ("book_value", "bookValue", None),
+)
+
+_FINANCIAL_HEALTH_FIELDS = (
+    ("profit_margin", "profitMargins", None),
+    ("operating_margin", "operatingMargins", None),
+    ("gross_margin", "grossMargins", None),
+    ("return_on_equity", "returnOnEquity", None),
+    ("return_on_assets", "returnOnAssets", None),
+    ("debt_to_equity", "debtToEquity", None),
+    ("current_ratio", "currentRatio", None),
+    ("quick_ratio", "quickRatio", None),
+    ("total_revenue", "totalRevenue", None),
+    ("revenue_growth", "revenueGrowth", None),
+    ("earnings_growth", "earningsGrowth", None),
+    ("ebitda", "ebitda", None),
+    ("free_cash_flow", "freeCashflow", None),
+    ("operating_cash_flow", "operatingCashflow", None),
+    ("total_cash", "totalCash", None),
+    ("total_debt", "totalDebt", None),
+)
+
+_DIVIDEND_FIELDS = (
+    ("dividend_yield", "dividendYield", None),
+    ("dividend_rate", "dividendRate", None),
+    ("payout_ratio", "payoutRatio", None),
+    ("ex_dividend_date", "exDividendDate", None),
+    ("last_dividend_value", "lastDividendValue", None),
+    ("last_dividend_date", "lastDividendDate", None),
+    ("five_year_avg_dividend_yield", "fiveYearAvgDividendYield", None),
+    ("trailing_annual_dividend_rate", "trailingAnnualDividendRate", None),
+    ("trailing_annual_dividend_yield", "trailingAnnualDividendYield", None),
+)
+
+_ANALYST_FIELDS = (
+    ("recommendation", "recommendationKey", "N/A"),
+    ("recommendation_mean", "recommendationMean", None),
+    ("number_of_analysts", "numberOfAnalystOpinions", None),
+    ("target_high", "targetHighPrice", None),
+    ("target_low", "targetLowPrice", None),
+    ("target_mean", "targetMeanPrice", None),
+    ("target_median", "targetMedianPrice", None),
+)
+
+_COMPARE_FIELDS = (
+    ("market_cap", "marketCap", None),
+    ("pe_ratio", "trailingPE", None),
+    ("forward_pe", "forwardPE", None),
+    ("dividend_yield", "dividendYield", None),
+    ("beta", "beta", None),
+    ("fifty_two_week_high", "fiftyTwoWeekHigh", None),
+    ("fifty_two_week_low", "fiftyTwoWeekLow", None),
+    ("profit_margin", "profitMargins", None),
+    ("revenue_growth", "revenueGrowth", None),
+)
+
+# Yahoo only serves intraday candles for recent windows: 1m for the last 8 days,
+# other minute intervals for 60 days, and hourly for 730 days (yfinance clamps
+# "max" to that window itself). Periods that clearly overshoot come back empty
+# after a full round-trip, so reject them up front.
+_INTRADAY_LOOKBACK_DAYS = {
+    "1m": 8,
+    "2m": 60,
+    "5m": 60,
+    "15m": 60,
+    "30m": 60,
+    "90m": 60,
+    "60m": 730,
+    "1h": 730,
+}
+_PERIOD_RE = re.compile(r"^([1-9]\d*)(d|wk|mo|y)$")
+# Shortest length of each period unit, so only windows that are too long in
+# every calendar get rejected.
+_PERIOD_UNIT_DAYS = {"d": 1, "wk": 7, "mo": 28, "y": 365}
+
+
+def _exceeds_lookback(period: str, interval: str) -> bool:
+    """True if ``period`` reaches further back than Yahoo keeps ``interval`` data.
+
+    Anything that can't be classified (daily+ intervals, "ytd", "max", unknown
+    spellings) is left for yfinance to handle.
+    """
+    lookback = _INTRADAY_LOOKBACK_DAYS.get(interval)
+    match = _PERIOD_RE.match(period)
+    if lookback is None or match is None:
+        return False
+    count, unit = match.groups()
+    return int(count) * _PERIOD_UNIT_DAYS[unit] > lookback
+
+
+def _pick(
+    info: dict[str, Any], fields: tuple[tuple[str, str, Any], ...]
+) -> dict[str, Any]:
+    get = info.get  # bound once, not per field
+    return {key: get(src, default) for key, src, default in fields}
+
+
+def _first(info: dict[str, Any], *keys: str) -> Any:
+    """Return the first truthy value among ``keys``, like chaining ``or``."""
+    get = info.get
+    value = None
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return value
 
 
 @mcp.tool()
@@ -23,6 +554,7 @@ async def get_current_quote(symbol: str) -> str:
     """Get the latest real-time quote for a stock including price, change, and volume.
 
     Use this to check the current trading price and today's performance of any stock.
+    Quotes are cached, so prices may be up to 30 seconds old.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL, MSFT, TSLA).
@@ -31,9 +563,11 @@ async def get_current_quote(symbol: str) -> str:
         JSON with current price, price change (absolute and percent), volume,
         bid/ask prices, and today's trading range.
     """
-    info = _get_ticker(symbol).info
-    current = info.get("currentPrice") or info.get("regularMarketPrice")
-    prev_close = info.get("previousClose")
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info, symbol)
+    current = _first(info, "currentPrice", "regularMarketPrice")
+    get = info.get
+    prev_close = get("previousClose")
 
     change = None
     change_pct = None
@@ -42,21 +576,19 @@ async def get_current_quote(symbol: str) -> str:
         change_pct = round((change / prev_close) * 100, 2)
 
     return _json(
-        {
-            "symbol": symbol.upper(),
-            "name": info.get("shortName", "N/A"),
-            "price": current,
-            "change": change,
-            "change_percent": change_pct,
-            "previous_close": prev_close,
-            "open": info.get("open") or info.get("regularMarketOpen"),
-            "day_high": info.get("dayHigh") or info.get("regularMarketDayHigh"),
-            "day_low": info.get("dayLow") or info.get("regularMarketDayLow"),
-            "volume": info.get("volume") or info.get("regularMarketVolume"),
-            "bid": info.get("bid"),
-            "ask": info.get("ask"),
-            "currency": info.get("currency", "USD"),
-        }
+        Quote(
+            symbol=symbol,
+            name=get("shortName", "N/A"),
+            price=current,
+            change=change,
+            change_percent=change_pct,
+            previous_close=prev_close,
+            open=_first(info, "open", "regularMarketOpen"),
+            day_high=_first(info, "dayHigh", "regularMarketDayHigh"),
+            day_low=_first(info, "dayLow", "regularMarketDayLow"),
+            volume=_first(info, "volume", "regularMarketVolume"),
+            **_pick(info, _QUOTE_FIELDS),
+        )
     )
 
 
@@ -69,40 +601,39 @@ async def get_price_history(
     """Get historical OHLCV (Open, High, Low, Close, Volume) price data for charting or analysis.
 
     Use this for technical analysis, plotting price charts, or analyzing price trends over time.
+    History is cached, so the latest candle may be up to 1 minute old.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
         period: How far back to retrieve data. Options: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max.
         interval: Time between data points. Options: 1m, 5m, 15m, 30m, 1h, 1d, 1wk, 1mo.
-            Note: Intraday intervals (1m-1h) only available for recent periods.
+            Note: Intraday intervals are limited to recent periods: 1m covers the
+            last 8 days, other minute intervals 60 days, and 1h 730 days.
 
     Returns:
-        JSON with array of OHLCV candles, each containing date, open, high, low, close, and volume.
+        JSON with OHLCV candles in columnar form: "history" holds parallel "date",
+        "open", "high", "low", "close", and "volume" arrays, where index i of each
+        array describes the same candle.
     """
-    hist = _get_ticker(symbol).history(period=period, interval=interval)
+    period, interval = period.lower(), interval.lower()
+    if _exceeds_lookback(period, interval):
+        return _json(
+            {"error": f"Unsupported period/interval combo: {period}/{interval}"}
+        )
 
-    if hist.empty:
-        return _json({"error": f"No historical data found for {symbol}"})
+    symbol = symbol.upper()
+    columns = await asyncio.to_thread(_history, symbol, period, interval)
 
-    records = [
-        {
-            "date": str(date),
-            "open": round(row["Open"], 2),
-            "high": round(row["High"], 2),
-            "low": round(row["Low"], 2),
-            "close": round(row["Close"], 2),
-            "volume": int(row["Volume"]),
-        }
-        for date, row in hist.iterrows()
-    ]
+    if not columns:
+        return _json({"error": f"No historical data found for {symbol}"})
 
     return _json(
         {
-            "symbol": symbol.upper(),
+            "symbol": symbol,
             "period": period,
             "interval": interval,
-            "data_points": len(records),
-            "history": records,
+            "data_points": len(columns["date"]),
+            "history": columns,
         }
     )
 
@@ -112,6 +643,7 @@ async def get_company_profile(symbol: str) -> str:
     """Get company business description, sector, industry, and corporate details.
 
     Use this to learn what a company does, its industry classification, and basic corporate info.
+    Profiles are cached for up to 1 hour.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
@@ -120,21 +652,18 @@ async def get_company_profile(symbol: str) -> str:
         JSON with company name, sector, industry, business description, country,
         website, employee count, and CEO name.
     """
-    info = _get_ticker(symbol).info
-    officers = info.get("companyOfficers", [])
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info_long, symbol)
+    get = info.get
+    officers = get("companyOfficers", [])
 
     return _json(
-        {
-            "symbol": symbol.upper(),
-            "name": info.get("longName") or info.get("shortName", "N/A"),
-            "sector": info.get("sector", "N/A"),
-            "industry": info.get("industry", "N/A"),
-            "description": info.get("longBusinessSummary", "N/A"),
-            "country": info.get("country", "N/A"),
-            "website": info.get("website", "N/A"),
-            "employees": info.get("fullTimeEmployees"),
-            "ceo": officers[0].get("name") if officers else "N/A",
-        }
+        CompanyProfile(
+            symbol=symbol,
+            name=get("longName") or get("shortName", "N/A"),
+            ceo=officers[0].get("name") if officers else "N/A",
+            **_pick(info, _PROFILE_FIELDS),
+        )
     )
 
 
@@ -143,6 +672,7 @@ async def get_key_statistics(symbol: str) -> str:
     """Get market statistics including market cap, 52-week range, beta, and shares outstanding.
 
     Use this for market sizing, volatility assessment, and understanding stock's market position.
+    Statistics are cached for up to 1 hour.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
@@ -151,25 +681,9 @@ async def get_key_statistics(symbol: str) -> str:
         JSON with market cap, enterprise value, 52-week high/low, beta,
         shares outstanding, float, and short interest data.
     """
-    info = _get_ticker(symbol).info
-    return _json(
-        {
-            "symbol": symbol.upper(),
-            "market_cap": info.get("marketCap"),
-            "enterprise_value": info.get("enterpriseValue"),
-            "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
-            "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
-            "fifty_day_average": info.get("fiftyDayAverage"),
-            "two_hundred_day_average": info.get("twoHundredDayAverage"),
-            "beta": info.get("beta"),
-            "shares_outstanding": info.get("sharesOutstanding"),
-            "float_shares": info.get("floatShares"),
-            "short_ratio": info.get("shortRatio"),
-            "short_percent_of_float": info.get("shortPercentOfFloat"),
-            "held_percent_insiders": info.get("heldPercentInsiders"),
-            "held_percent_institutions": info.get("heldPercentInstitutions"),
-        }
-    )
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info_long, symbol)
+    return _json(KeyStatistics(symbol=symbol, **_pick(info, _KEY_STATISTICS_FIELDS)))
 
 
 @mcp.tool()
@@ -177,6 +691,7 @@ async def get_valuation_metrics(symbol: str) -> str:
     """Get valuation ratios like P/E, P/B, PEG, and EV/EBITDA for fundamental analysis.
 
     Use this to assess if a stock is overvalued or undervalued relative to earnings and assets.
+    Ratios are cached for up to 1 hour.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
@@ -185,22 +700,9 @@ async def get_valuation_metrics(symbol: str) -> str:
         JSON with trailing P/E, forward P/E, PEG ratio, price-to-book,
         price-to-sales, and EV/EBITDA ratios.
     """
-    info = _get_ticker(symbol).info
-    return _json(
-        {
-            "symbol": symbol.upper(),
-            "trailing_pe": info.get("trailingPE"),
-            "forward_pe": info.get("forwardPE"),
-            "peg_ratio": info.get("pegRatio"),
-            "price_to_book": info.get("priceToBook"),
-            "price_to_sales": info.get("priceToSalesTrailing12Months"),
-            "enterprise_to_revenue": info.get("enterpriseToRevenue"),
-            "enterprise_to_ebitda": info.get("enterpriseToEbitda"),
-            "trailing_eps": info.get("trailingEps"),
-            "forward_eps": info.get("forwardEps"),
-            "book_value": info.get("bookValue"),
-        }
-    )
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info_long, symbol)
+    return _json(ValuationMetrics(symbol=symbol, **_pick(info, _VALUATION_FIELDS)))
 
 
 @mcp.tool()
@@ -208,6 +710,7 @@ async def get_financial_health(symbol: str) -> str:
     """Get profitability, margins, returns, and balance sheet health indicators.
 
     Use this to assess a company's financial strength, profitability, and operational efficiency.
+    Figures are cached for up to 1 hour.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
@@ -216,27 +719,10 @@ async def get_financial_health(symbol: str) -> str:
         JSON with profit margins, ROE, ROA, debt-to-equity, current ratio,
         revenue, EBITDA, and cash flow metrics.
     """
-    info = _get_ticker(symbol).info
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info_long, symbol)
     return _json(
-        {
-            "symbol": symbol.upper(),
-            "profit_margin": info.get("profitMargins"),
-            "operating_margin": info.get("operatingMargins"),
-            "gross_margin": info.get("grossMargins"),
-            "return_on_equity": info.get("returnOnEquity"),
-            "return_on_assets": info.get("returnOnAssets"),
-            "debt_to_equity": info.get("debtToEquity"),
-            "current_ratio": info.get("currentRatio"),
-            "quick_ratio": info.get("quickRatio"),
-            "total_revenue": info.get("totalRevenue"),
-            "revenue_growth": info.get("revenueGrowth"),
-            "earnings_growth": info.get("earningsGrowth"),
-            "ebitda": info.get("ebitda"),
-            "free_cash_flow": info.get("freeCashflow"),
-            "operating_cash_flow": info.get("operatingCashflow"),
-            "total_cash": info.get("totalCash"),
-            "total_debt": info.get("totalDebt"),
-        }
+        FinancialHealth(symbol=symbol, **_pick(info, _FINANCIAL_HEALTH_FIELDS))
     )
 
 
@@ -245,6 +731,7 @@ async def get_dividend_info(symbol: str) -> str:
     """Get dividend yield, payout ratio, and dividend history details.
 
     Use this to evaluate a stock's income potential and dividend sustainability.
+    Dividend data is cached for up to 1 hour.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, KO, JNJ).
@@ -253,21 +740,9 @@ async def get_dividend_info(symbol: str) -> str:
         JSON with dividend yield, annual dividend rate, payout ratio,
         ex-dividend date, and 5-year average yield.
     """
-    info = _get_ticker(symbol).info
-    return _json(
-        {
-            "symbol": symbol.upper(),
-            "dividend_yield": info.get("dividendYield"),
-            "dividend_rate": info.get("dividendRate"),
-            "payout_ratio": info.get("payoutRatio"),
-            "ex_dividend_date": info.get("exDividendDate"),
-            "last_dividend_value": info.get("lastDividendValue"),
-            "last_dividend_date": info.get("lastDividendDate"),
-            "five_year_avg_dividend_yield": info.get("fiveYearAvgDividendYield"),
-            "trailing_annual_dividend_rate": info.get("trailingAnnualDividendRate"),
-            "trailing_annual_dividend_yield": info.get("trailingAnnualDividendYield"),
-        }
-    )
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info_long, symbol)
+    return _json(DividendInfo(symbol=symbol, **_pick(info, _DIVIDEND_FIELDS)))
 
 
 @mcp.tool()
@@ -275,6 +750,7 @@ async def get_analyst_targets(symbol: str) -> str:
     """Get Wall Street analyst price targets and buy/sell/hold recommendations.
 
     Use this to see what professional analysts think about a stock's future price.
+    Targets are cached, so the current price may be up to 30 seconds old.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
@@ -283,33 +759,38 @@ async def get_analyst_targets(symbol: str) -> str:
         JSON with consensus recommendation, number of analysts, price target
         (high, low, mean, median), and calculated upside potential.
     """
-    info = _get_ticker(symbol).info
-    current = info.get("currentPrice") or info.get("regularMarketPrice")
-    target_mean = info.get("targetMeanPrice")
-
-    data = {
-        "symbol": symbol.upper(),
-        "recommendation": info.get("recommendationKey", "N/A"),
-        "recommendation_mean": info.get("recommendationMean"),
-        "number_of_analysts": info.get("numberOfAnalystOpinions"),
-        "target_high": info.get("targetHighPrice"),
-        "target_low": info.get("targetLowPrice"),
-        "target_mean": target_mean,
-        "target_median": info.get("targetMedianPrice"),
-        "current_price": current,
-    }
+    symbol = symbol.upper()
+    info = await asyncio.to_thread(_info, symbol)
+    current = _first(info, "currentPrice", "regularMarketPrice")
+
+    data = AnalystTargets(
+        symbol=symbol,
+        current_price=current,
+        **_pick(info, _ANALYST_FIELDS),
+    )
 
-    if target_mean and current:
-        data["upside_percent"] = round((target_mean - current) / current * 100, 2)
+    if data.target_mean and current:
+        data.upside_percent = round((data.target_mean - current) / current * 100, 2)
 
     return _json(data)
 
 
+def _news_article(item: dict[str, Any]) -> NewsArticle:
+    get = item.get
+    return NewsArticle(
+        title=get("title"),
+        publisher=get("publisher"),
+        link=get("link"),
+        published=get("providerPublishTime"),
+    )
+
+
 @mcp.tool()
 async def get_stock_news(symbol: str, max_articles: int = 10) -> str:
     """Get recent news headlines and articles about a specific stock.
 
     Use this to stay informed about company developments, earnings, and market-moving events.
+    Headlines are cached, so articles from the last 5 minutes may be missing.
 
     Args:
         symbol: Stock ticker symbol (e.g., AAPL, GOOGL).
@@ -318,35 +799,51 @@ async def get_stock_news(symbol: str, max_articles: int = 10) -> str:
     Returns:
         JSON array of news articles with title, publisher, link, and publish timestamp.
     """
-    news = _get_ticker(symbol).news
-    max_articles = min(max_articles, 25)
+    symbol = symbol.upper()
+    news = await asyncio.to_thread(_news, symbol)
 
     if not news:
         return _json({"message": f"No recent news found for {symbol}"})
 
+    articles = news[: min(max_articles, 25)]
     return _json(
-        {
-            "symbol": symbol.upper(),
-            "article_count": min(len(news), max_articles),
-            "articles": [
-                {
-                    "title": item.get("title"),
-                    "publisher": item.get("publisher"),
-                    "link": item.get("link"),
-                    "published": item.get("providerPublishTime"),
-                }
-                for item in news[:max_articles]
-            ],
-        }
+        StockNews(
+            symbol=symbol,
+            article_count=len(articles),
+            articles=[_news_article(item) for item in articles],
+        )
     )
 
 
+def _fetch_compare_row(symbol: str) -> ComparisonRow | ComparisonError:
+    try:
+        info = _info(symbol)
+        current = _first(info, "currentPrice", "regularMarketPrice")
+        get = info.get
+        year_low = get("fiftyTwoWeekLow")
+
+        ytd_change = None
+        if current and year_low:
+            ytd_change = round((current - year_low) / year_low * 100, 2)
+
+        return ComparisonRow(
+            symbol=symbol,
+            name=get("shortName", "N/A"),
+            price=current,
+            percent_from_52w_low=ytd_change,
+            **_pick(info, _COMPARE_FIELDS),
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return ComparisonError(symbol=symbol, error=str(e))
+
+
 @mcp.tool()
 async def compare_stocks(symbols: list[str]) -> str:
     """Compare key metrics across multiple stocks side-by-side.
 
     Use this to compare valuations, performance, and fundamentals of competing stocks
     or portfolio candidates.
+    Metrics are cached, so prices may be up to 30 seconds old.
 
     Args:
         symbols: List of 2-10 ticker symbols to compare (e.g., ["AAPL", "MSFT", "GOOGL"]).
@@ -355,41 +852,16 @@ async def compare_stocks(symbols: list[str]) -> str:
         JSON array with each stock's price, market cap, P/E, dividend yield,
         and year-to-date performance for easy comparison.
     """
-    symbols = symbols[:10]  # Limit to 10 symbols
-    results = []
-
-    for symbol in symbols:
-        try:
-            info = _get_ticker(symbol).info
-            current = info.get("currentPrice") or info.get("regularMarketPrice")
-            year_high = info.get("fiftyTwoWeekHigh")
-            year_low = info.get("fiftyTwoWeekLow")
-
-            ytd_change = None
-            if current and year_low:
-                ytd_change = round((current - year_low) / year_low * 100, 2)
-
-            results.append(
-                {
-                    "symbol": symbol.upper(),
-                    "name": info.get("shortName", "N/A"),
-                    "price": current,
-                    "market_cap": info.get("marketCap"),
-                    "pe_ratio": info.get("trailingPE"),
-                    "forward_pe": info.get("forwardPE"),
-                    "dividend_yield": info.get("dividendYield"),
-                    "beta": info.get("beta"),
-                    "fifty_two_week_high": year_high,
-                    "fifty_two_week_low": year_low,
-                    "percent_from_52w_low": ytd_change,
-                    "profit_margin": info.get("profitMargins"),
-                    "revenue_growth": info.get("revenueGrowth"),
-                }
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            results.append({"symbol": symbol.upper(), "error": str(e)})
-
-    return _json({"comparison": results, "stocks_compared": len(results)})
+    symbols = [symbol.upper() for symbol in symbols[:10]]  # Limit to 10 symbols
+    # yfinance has no batched info endpoint, so fan out one lookup per distinct
+    # symbol concurrently; yfinance shares one session and cookie/crumb across Tickers.
+    unique = list(dict.fromkeys(symbols))
+    rows = await asyncio.gather(
+        *(asyncio.to_thread(_fetch_compare_row, symbol) for symbol in unique)
+    )
+    by_symbol = dict(zip(unique, rows))
+    results = [by_symbol[symbol] for symbol in symbols]
+    return _json(Comparison(comparison=results, stocks_compared=len(results)))
 
 
 if __name__ == "__main__":